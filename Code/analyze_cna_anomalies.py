@@ -11,11 +11,16 @@ Usage:
 
 import os
 import json
+import re
+import subprocess
 import sys
-from datetime import datetime, timedelta
-from pathlib import Path
-from collections import defaultdict
-import statistics
+from datetime import timedelta
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+import pandas as pd
 
 try:
     import requests
@@ -23,18 +28,167 @@ except ImportError:
     requests = None
     print("Warning: requests module not found. CNA organization names will not be available.")
 
+try:
+    import simdjson
+except ImportError:
+    simdjson = None  # Fall back to orjson or the standard json module
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard json module
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None  # Parse cache disabled, every run re-parses all files
+
+# Fields extracted from each CVE record
+CVE_FIELDS = ('cveId', 'datePublished', 'assignerOrgId', 'assignerShortName')
+
+# Columns of the parse cache: the file, its git blob SHA, whether it was fully parsed,
+# and the extracted fields
+PARSE_CACHE_COLUMNS = ('path', 'blob_sha', 'parsed') + CVE_FIELDS
+
+# Publish date prefix as it appears in the raw CVE record
+_DATE_PUBLISHED_RE = re.compile(rb'"datePublished"\s*:\s*"(\d{4}-\d{2}-\d{2})')
+
+_simdjson_parser = None  # Per-process simdjson parser, created on first use
+
+
+def _iter_json_files(root):
+    """Recursively yield paths of .json files under root using os.scandir."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                yield from _iter_json_files(entry.path)
+            elif entry.name.endswith('.json'):
+                yield entry.path
+
+
+def _extract_cve_fields(data):
+    """
+    Extract the required fields from a parsed CVE record in one pass.
+    Returns a tuple of values in CVE_FIELDS order.
+    """
+    cve_metadata = data.get('cveMetadata') or {}
+    
+    # Extract CNA name using CNAScoreCard approach
+    # Use containers.cna.providerMetadata.shortName (more accurate),
+    # falling back to assignerShortName if providerMetadata not available
+    cna_container = (data.get('containers') or {}).get('cna') or {}
+    provider_metadata = cna_container.get('providerMetadata') or {}
+    cna_short_name = provider_metadata.get('shortName') or cve_metadata.get('assignerShortName') or 'Unknown'
+    
+    # CNA IDs and names repeat across thousands of CVEs, so intern them
+    # (this also lets pickle send each one once per chunk)
+    return (
+        cve_metadata.get('cveId', 'Unknown'),
+        cve_metadata.get('datePublished', ''),
+        sys.intern(cve_metadata.get('assignerOrgId') or 'Unknown'),
+        sys.intern(cna_short_name)
+    )
+
+
+def _parse_one_file(json_file, min_date=None):
+    """
+    Parse a single CVE JSON file and extract the required fields.
+    Runs in worker processes, so errors are returned instead of raised.
+    Returns a (cve_entry, parsed, error) tuple; on error cve_entry is None,
+    otherwise cve_entry is a tuple of values in CVE_FIELDS order.
+    Files published before min_date ("YYYY-MM-DD") are not parsed (parsed is
+    False); their entry only carries datePublished, the other fields are None.
+    """
+    global _simdjson_parser
+    
+    try:
+        # Read raw bytes; all parsers accept UTF-8 bytes directly, so no text decode pass
+        with open(json_file, 'rb') as f:
+            raw = f.read()
+        
+        # Cheap pre-check on the raw bytes so old CVEs skip the full JSON parse.
+        # ISO dates compare correctly as strings.
+        if min_date:
+            match = _DATE_PUBLISHED_RE.search(raw)
+            if match:
+                date_published = match.group(1).decode('ascii')
+                if date_published < min_date:
+                    return (None, date_published, None, None), False, None
+        
+        if simdjson:
+            # Reuse one parser per process so its internal buffers are amortized across files.
+            # simdjson documents are only valid until the parser is reused, so all
+            # lookups happen here and only plain strings leave this function.
+            if _simdjson_parser is None:
+                _simdjson_parser = simdjson.Parser()
+            data = _simdjson_parser.parse(raw)
+        elif orjson:
+            data = orjson.loads(raw)
+        else:
+            data = json.loads(raw)
+        
+        return _extract_cve_fields(data), True, None
+    
+    except (json.JSONDecodeError, KeyError, Exception) as e:
+        return None, False, str(e)
+
+
+def _dumps_json(value):
+    """Serialize a value to UTF-8 JSON bytes with 2-space indentation."""
+    if orjson:
+        # orjson serializes straight to bytes and is much faster than the json module
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2)
+    return json.dumps(value, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Labels for the 12 rolling 30-day baseline windows, oldest first ("Days 360-330" ... "Days 60-30")
+TIMELINE_LABELS = [f"Days {(i * 30) + 30}-{i * 30}" for i in range(12, 0, -1)]
+
+
+def _classify_activity(avg_monthly, current_counts):
+    """
+    Classify CNAs against their baseline in a single vectorized pass.
+    Takes arrays of baseline monthly averages and current counts.
+    Returns arrays of (status, threshold_low, threshold_high, deviation_pct).
+    """
+    # Status thresholds
+    # Normal = within 50% to 250% of baseline (-50% to +150% growth)
+    # Declining = below 50% of baseline (below -50% from baseline)
+    # Growth = above 250% of baseline (above +150% growth)
+    threshold_low = avg_monthly * 0.5  # Below 50% of baseline is Declining
+    threshold_high = avg_monthly * 2.5  # Above 250% of baseline is Growth
+    
+    # Growth: Above 250% of baseline (+150% growth)
+    growth = current_counts > threshold_high
+    
+    # Declining: Below 50% of baseline (-50% from baseline)
+    # Only flag if baseline was meaningful (>=0.5 CVEs/month)
+    declining = ~growth & (current_counts < threshold_low) & (avg_monthly >= 0.5)
+    
+    # Otherwise: Normal (within 50% to 250% of baseline)
+    status = np.select([growth, declining], ['Growth', 'Declining'], default='Normal')
+    
+    deviation_pct = np.zeros_like(avg_monthly)
+    np.divide(current_counts - avg_monthly, avg_monthly, out=deviation_pct, where=avg_monthly > 0)
+    deviation_pct *= 100
+    
+    return status, threshold_low, threshold_high, deviation_pct
+
 
 class CVEMonitor:
     """Main class for CVE monitoring and anomaly detection."""
     
     def __init__(self):
         self.cves_dir = 'cvelistV5/cves'
-        self.now = datetime.now()
+        self.parse_cache_file = '.cache/cve_records.parquet'  # Extracted fields keyed by file path and git blob SHA
+        self.cna_list_cache_file = '.cache/cna_list.json'  # Last downloaded official CNA list
+        self.cna_list_etag_file = '.cache/cna_list_etag.txt'  # ETag of the cached CNA list
+        self.now = pd.Timestamp.now(tz='UTC')  # tz-aware to compare directly with parsed CVE dates
         self.monitoring_window = 30  # days
         self.baseline_months = 12  # months
-        self.cna_org_names = {}  # Map CNA short names to organization names (includes lowercase)
+        self.cna_org_names = {}  # Map case-folded CNA short names to organization names (one entry per official CNA)
         self.cna_by_uuid = {}  # Map UUID to CNA info for better matching
-        self.official_cna_list = set()  # Set of official CNA short names (no duplicates)
         
     def load_cna_organization_names(self):
         """Download and cache CNA organization names from official list."""
@@ -43,13 +197,8 @@ class CVEMonitor:
             return
         
         try:
-            print("Downloading official CNA list...")
-            url = "https://raw.githubusercontent.com/CVEProject/cve-website/dev/src/assets/data/CNAsList.json"
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            
-            cna_list = response.json()
-            print(f"Downloaded {len(cna_list)} CNAs from official list")
+            cna_list = self.fetch_cna_list()
+            print(f"Loaded {len(cna_list)} CNAs from official list")
             
             # Map shortName to organizationName and advisory URL
             for cna in cna_list:
@@ -80,38 +229,68 @@ class CVEMonitor:
                     'uuid': uuid
                 }
                 
-                # Index by shortName (exact)
+                # Index by case-folded shortName for case-insensitive lookup
                 if short_name:
-                    self.cna_org_names[short_name] = cna_info
-                    # Also index by lowercase for case-insensitive lookup
-                    self.cna_org_names[short_name.lower()] = cna_info
-                    # Track official CNA names (no duplicates)
-                    self.official_cna_list.add(short_name)
+                    self.cna_org_names[short_name.casefold()] = cna_info
                 
                 # Index by UUID for more reliable matching
                 if uuid:
                     self.cna_by_uuid[uuid] = cna_info
             
-            print(f"Mapped {len(self.cna_org_names)} CNA organization name entries")
-            print(f"Official CNAs: {len(self.official_cna_list)}")
+            print(f"Official CNAs: {len(self.cna_org_names)}")
             print(f"Mapped {len(self.cna_by_uuid)} CNAs by UUID")
             
         except Exception as e:
             print(f"Warning: Could not download CNA list: {e}")
             print("Will use short names only")
     
+    def fetch_cna_list(self):
+        """
+        Download the official CNA list, reusing the cached copy if it hasn't changed.
+        Sends the ETag from the previous download so unchanged lists cost a 304 only.
+        """
+        print("Downloading official CNA list...")
+        url = "https://raw.githubusercontent.com/CVEProject/cve-website/dev/src/assets/data/CNAsList.json"
+        
+        headers = {}
+        if os.path.exists(self.cna_list_cache_file) and os.path.exists(self.cna_list_etag_file):
+            with open(self.cna_list_etag_file, 'r', encoding='utf-8') as f:
+                headers['If-None-Match'] = f.read().strip()
+        
+        response = requests.get(url, headers=headers, timeout=30)
+        
+        if response.status_code == 304:
+            print("CNA list not modified, using cached copy")
+            with open(self.cna_list_cache_file, 'rb') as f:
+                return json.load(f)
+        
+        response.raise_for_status()
+        cna_list = response.json()
+        
+        # Cache the list and its ETag for the next run
+        etag = response.headers.get('ETag')
+        if etag:
+            try:
+                cache_dir = os.path.dirname(self.cna_list_cache_file)
+                if cache_dir:
+                    os.makedirs(cache_dir, exist_ok=True)
+                with open(self.cna_list_cache_file, 'wb') as f:
+                    f.write(response.content)
+                with open(self.cna_list_etag_file, 'w', encoding='utf-8') as f:
+                    f.write(etag)
+            except OSError as e:
+                print(f"Warning: Could not cache CNA list: {e}")
+        
+        return cna_list
+    
     def get_cna_info(self, short_name, assigner_id):
         """
         Look up CNA info with multiple fallback strategies.
         Returns dict with org_name and advisory_url.
         """
-        # Try exact match on short name
-        if short_name in self.cna_org_names:
-            return self.cna_org_names[short_name]
-        
-        # Try lowercase match
-        if short_name and short_name.lower() in self.cna_org_names:
-            return self.cna_org_names[short_name.lower()]
+        # Try case-insensitive match on short name
+        if short_name and short_name.casefold() in self.cna_org_names:
+            return self.cna_org_names[short_name.casefold()]
         
         # Try UUID match
         if assigner_id in self.cna_by_uuid:
@@ -128,106 +307,188 @@ class CVEMonitor:
     def parse_cve_files(self):
         """
         Recursively parse all CVE JSON files and extract required fields.
-        Returns a list of dictionaries with CVE data.
+        Returns a dict of parallel lists, one per field in CVE_FIELDS.
         """
         print(f"Parsing CVE files from {self.cves_dir}...")
-        cve_data = []
         
         if not os.path.exists(self.cves_dir):
             print(f"Error: CVEs directory not found: {self.cves_dir}")
-            return cve_data
+            return {field: [] for field in CVE_FIELDS}
         
         # Recursively find all .json files
-        json_files = list(Path(self.cves_dir).rglob("*.json"))
+        json_files = list(_iter_json_files(self.cves_dir))
         total_files = len(json_files)
         print(f"Found {total_files} JSON files to process...")
         
+        # Extracted records are kept as parallel lists (one per column) rather than a dict per CVE
+        records = {column: [] for column in PARSE_CACHE_COLUMNS}
+        
+        # CVEs published before the baseline window are never analyzed, so their files are
+        # only scanned for the publish date. The CVE ID year can't be used for this because
+        # IDs reserved years ago are still being published. One day of slack covers offsets.
+        baseline_start, _ = self.get_analysis_window()
+        min_date = (baseline_start - timedelta(days=1)).strftime('%Y-%m-%d')
+        
+        # Reuse cached records for files whose content hasn't changed since the last run.
+        # Files are matched on git blob SHA, which (unlike mtime) survives a fresh clone.
+        cache = self.load_parse_cache()
+        cached_rows = {path: i for i, path in enumerate(cache.get('path', []))}
+        blob_shas = self.get_blob_shas() if pq else {}
+        stale_files = []
+        for path in json_files:
+            i = cached_rows.get(path)
+            blob_sha = blob_shas.get(path)
+            reusable = i is not None and blob_sha is not None and cache['blob_sha'][i] == blob_sha
+            
+            # Skipped files are only reusable while they still fall before the window
+            if reusable and not cache['parsed'][i] and cache['datePublished'][i] >= min_date:
+                reusable = False
+            
+            if reusable:
+                for column, values in records.items():
+                    values.append(cache[column][i])
+            else:
+                stale_files.append(path)
+        reused = len(records['path'])
+        
+        if cache:
+            print(f"Reusing {reused} cached records, {len(stale_files)} files to parse...")
+        json_parser = 'simdjson' if simdjson else 'orjson' if orjson else 'json'
+        print(f"Using {json_parser} parser with {os.cpu_count()} worker processes")
+        
         processed = 0
+        skipped = 0
         errors = 0
         
-        for json_file in json_files:
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+        # Files are independent, so parse them in parallel. A large chunksize keeps
+        # pickling overhead low for hundreds of thousands of small files.
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(partial(_parse_one_file, min_date=min_date), stale_files, chunksize=256)
+            
+            for json_file, (cve_entry, parsed, error) in zip(stale_files, results):
+                if error:
+                    errors += 1
+                    if errors <= 10:  # Only print first 10 errors
+                        print(f"Error processing {json_file}: {error}")
+                    continue
                 
-                # Extract required fields
-                cve_metadata = data.get('cveMetadata', {})
+                if not parsed:  # Published before the window
+                    skipped += 1
                 
-                # Extract CNA name using CNAScoreCard approach
-                # Use containers.cna.providerMetadata.shortName (more accurate)
-                containers = data.get('containers', {})
-                cna_container = containers.get('cna', {})
-                provider_metadata = cna_container.get('providerMetadata', {})
-                cna_short_name = provider_metadata.get('shortName')
-                
-                # Fallback to assignerShortName if providerMetadata not available
-                if not cna_short_name:
-                    cna_short_name = cve_metadata.get('assignerShortName', 'Unknown')
-                
-                cve_entry = {
-                    'cveId': cve_metadata.get('cveId', 'Unknown'),
-                    'datePublished': cve_metadata.get('datePublished', ''),
-                    'assignerOrgId': cve_metadata.get('assignerOrgId', 'Unknown'),
-                    'assignerShortName': cna_short_name
-                }
-                
-                # Only add if we have a valid date
-                if cve_entry['datePublished']:
-                    cve_data.append(cve_entry)
+                records['path'].append(json_file)
+                records['blob_sha'].append(blob_shas.get(json_file))
+                records['parsed'].append(parsed)
+                for field, value in zip(CVE_FIELDS, cve_entry):
+                    records[field].append(value)
                 
                 processed += 1
                 if processed % 10000 == 0:
-                    print(f"Processed {processed}/{total_files} files...")
-                    
-            except (json.JSONDecodeError, KeyError, Exception) as e:
-                errors += 1
-                if errors <= 10:  # Only print first 10 errors
-                    print(f"Error processing {json_file}: {e}")
+                    print(f"Processed {processed}/{len(stale_files)} files...")
+        
+        # Rewrite the cache if anything was parsed or cached files were changed/removed
+        if blob_shas and (processed or reused != len(cached_rows)):
+            self.save_parse_cache(records)
+        
+        # Only keep fully parsed records with a valid date inside the analysis range
+        valid_rows = [
+            i for i, (parsed, date_published) in enumerate(zip(records['parsed'], records['datePublished']))
+            if parsed and date_published and date_published >= min_date
+        ]
+        cve_data = {field: [records[field][i] for i in valid_rows] for field in CVE_FIELDS}
+        
+        # Unpickled and cached rows hold separate copies of each CNA string, so intern them again
+        for field in ('assignerOrgId', 'assignerShortName'):
+            cve_data[field] = [sys.intern(value) for value in cve_data[field]]
         
         print(f"Parsing complete. Processed: {processed}, Errors: {errors}")
-        print(f"Successfully extracted {len(cve_data)} CVE records")
+        if skipped:
+            print(f"Skipped full parse of {skipped} files published before {min_date}")
+        print(f"Successfully extracted {len(valid_rows)} CVE records")
         return cve_data
     
-    def parse_date(self, date_str):
-        """Parse ISO date string to datetime object."""
+    def load_parse_cache(self):
+        """
+        Load previously extracted CVE records from the parse cache.
+        Returns a dict of column lists (PARSE_CACHE_COLUMNS), empty if unavailable.
+        """
+        if not pq or not os.path.exists(self.parse_cache_file):
+            return {}
+        
         try:
-            # Handle various ISO 8601 formats
-            if 'T' in date_str:
-                # Remove timezone info for simplicity
-                date_str = date_str.split('+')[0].split('Z')[0].split('.')[0]
-                return datetime.fromisoformat(date_str)
-            else:
-                return datetime.fromisoformat(date_str)
-        except (ValueError, AttributeError):
-            return None
+            cache = pq.read_table(self.parse_cache_file).to_pydict()
+            if tuple(cache) != PARSE_CACHE_COLUMNS:
+                print("Parse cache was written with a different layout, ignoring it")
+                return {}
+            return cache
+        except Exception as e:
+            print(f"Warning: Could not read parse cache: {e}")
+            return {}
     
-    def generate_13month_timeline(self, monthly_data, current_count, monitoring_window_days=30):
-        """Generate 13-period timeline: 12 rolling 30-day baseline windows + current 30-day period."""
-        timeline = []
-        
-        # Generate 12 rolling 30-day windows for baseline
-        for i in range(12, 0, -1):
-            # Calculate the end date of this 30-day window
-            window_end = self.now - timedelta(days=(i * 30))
-            window_start = window_end - timedelta(days=30)
-            
-            # Use month key based on the window's midpoint for grouping
-            midpoint = window_start + timedelta(days=15)
-            month_key = (midpoint.year, midpoint.month)
-            
-            count = monthly_data.get(month_key, 0)
-            
-            # Create clear label showing it's a 30-day window
-            # Format: "Days 330-360" for readability
-            days_ago_end = i * 30
-            days_ago_start = days_ago_end + 30
-            period_label = f"Days {days_ago_start}-{days_ago_end}"
+    def get_blob_shas(self):
+        """
+        Get the git blob SHA of every tracked file under the CVEs directory, keyed by path.
+        Returns an empty dict if the directory isn't a git checkout.
+        """
+        try:
+            result = subprocess.run(
+                ['git', '-C', self.cves_dir, 'ls-files', '-s', '-z'],
+                capture_output=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"Warning: Could not list git blob SHAs, parse cache disabled: {e}")
+            return {}
+        
+        # Each entry is "<mode> <sha> <stage>\t<path>", with paths relative to the CVEs directory
+        blob_shas = {}
+        for entry in result.stdout.decode('utf-8').split('\0'):
+            if entry:
+                info, path = entry.split('\t', 1)
+                blob_shas[os.path.join(self.cves_dir, path)] = info.split()[1]
+        return blob_shas
+    
+    def save_parse_cache(self, records):
+        """Write extracted CVE records (dict of column lists) to the parse cache as a Parquet file."""
+        try:
+            cache_dir = os.path.dirname(self.parse_cache_file)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
             
-            timeline.append({
-                'month': period_label,
-                'count': count,
-                'is_current': False
-            })
+            pq.write_table(pa.Table.from_pydict(records), self.parse_cache_file, compression='zstd')
+        except Exception as e:
+            print(f"Warning: Could not write parse cache: {e}")
+    
+    def get_analysis_window(self):
+        """
+        Get the (baseline_start, monitoring_start) boundaries of the analysis window.
+        The baseline ends where monitoring starts, and monitoring runs up to now.
+        Shared by parsing and analysis so the skip filter always matches the window.
+        """
+        monitoring_start = self.now - timedelta(days=self.monitoring_window)
+        baseline_start = monitoring_start - timedelta(days=self.baseline_months * 30)
+        return baseline_start, monitoring_start
+    
+    def get_timeline_months(self):
+        """
+        Get the calendar month used for each of the 12 rolling 30-day baseline windows.
+        Each window is represented by the month of its midpoint, oldest first.
+        Months are integer keys (year * 12 + month - 1), matching the baseline buckets.
+        """
+        months = []
+        for i in range(12, 0, -1):
+            # Window ends i*30 days ago and starts 30 days before that
+            midpoint = self.now - timedelta(days=(i * 30) + 15)
+            months.append(midpoint.year * 12 + midpoint.month - 1)
+        return months
+    
+    def generate_13month_timeline(self, baseline_counts, current_count):
+        """
+        Generate 13-period timeline: 12 rolling 30-day baseline windows + current 30-day period.
+        baseline_counts holds the count for each baseline window, oldest first.
+        """
+        timeline = [
+            {'month': label, 'count': count, 'is_current': False}
+            for label, count in zip(TIMELINE_LABELS, baseline_counts)
+        ]
         
         # Add current 30-day period
         timeline.append({
@@ -243,8 +504,7 @@ class CVEMonitor:
         print("\nAnalyzing CNA activity...")
         
         # Calculate date boundaries
-        monitoring_start = self.now - timedelta(days=self.monitoring_window)
-        baseline_start = self.now - timedelta(days=self.monitoring_window + (self.baseline_months * 30))
+        baseline_start, monitoring_start = self.get_analysis_window()
         baseline_end = monitoring_start
         recent_activity_cutoff = self.now - timedelta(days=14)  # Check last 14 days for recent activity
         
@@ -252,57 +512,61 @@ class CVEMonitor:
         print(f"Baseline period: {baseline_start.date()} to {baseline_end.date()}")
         print(f"Recent activity check: {recent_activity_cutoff.date()} to {self.now.date()}")
         
-        # Data structures
-        baseline_counts = defaultdict(list)  # {assignerOrgId: [monthly counts]}
-        monitoring_counts = defaultdict(int)  # {assignerOrgId: count}
-        recent_activity_counts = defaultdict(int)  # {assignerOrgId: count in last 14 days}
-        last_cve_dates = {}  # {assignerOrgId: most recent CVE date}
-        cna_names = {}  # {assignerOrgId: assignerShortName}
-        
-        # Process each CVE
-        for cve in cve_data:
-            date_published = self.parse_date(cve['datePublished'])
-            if not date_published:
-                continue
-            
-            assigner_id = cve['assignerOrgId']
-            cna_names[assigner_id] = cve['assignerShortName']
-            
-            # Track most recent CVE date for each CNA (across all time)
-            if assigner_id not in last_cve_dates or date_published > last_cve_dates[assigner_id]:
-                last_cve_dates[assigner_id] = date_published
-            
-            # Check if in monitoring window
-            if monitoring_start <= date_published <= self.now:
-                monitoring_counts[assigner_id] += 1
-                
-                # Also track recent activity (last 14 days)
-                if date_published >= recent_activity_cutoff:
-                    recent_activity_counts[assigner_id] += 1
-            
-            # Check if in baseline period
-            elif baseline_start <= date_published < baseline_end:
-                baseline_counts[assigner_id].append(date_published)
-        
-        # Calculate monthly averages for baseline
-        cna_baselines = {}
-        for assigner_id, dates in baseline_counts.items():
-            if dates:
-                # Group by month
-                monthly_counts = defaultdict(int)
-                for date in dates:
-                    month_key = (date.year, date.month)
-                    monthly_counts[month_key] += 1
-                
-                # Calculate average
-                if monthly_counts:
-                    avg_monthly = sum(monthly_counts.values()) / len(monthly_counts)
-                    cna_baselines[assigner_id] = {
-                        'avg_monthly': avg_monthly,
-                        'short_name': cna_names.get(assigner_id, 'Unknown'),
-                        'monthly_counts': list(monthly_counts.values()),
-                        'monthly_data': dict(monthly_counts)  # Store month keys for timeline
-                    }
+        # Load CVEs into a DataFrame once so bucketing runs vectorized instead of per CVE
+        df = pd.DataFrame(cve_data, columns=list(CVE_FIELDS))
+        df['dt'] = pd.to_datetime(df['datePublished'], format='ISO8601', utc=True, errors='coerce')
+        df = df.dropna(subset=['dt'])
+        
+        # Each CNA's most recent CVE in the parsed window supplies its short name and last CVE date
+        latest = df.loc[df.groupby('assignerOrgId', sort=False)['dt'].idxmax()]
+        cna_names = dict(zip(latest['assignerOrgId'], latest['assignerShortName']))  # {assignerOrgId: assignerShortName}
+        last_cve_dates = dict(zip(latest['assignerOrgId'], latest['dt']))  # {assignerOrgId: most recent CVE date}
+        
+        # Window masks (baseline ends where monitoring starts, so they never overlap)
+        in_monitoring = (df['dt'] >= monitoring_start) & (df['dt'] <= self.now)
+        in_baseline = (df['dt'] >= baseline_start) & (df['dt'] < baseline_end)
+        
+        monitoring_counts = df[in_monitoring].groupby('assignerOrgId').size().to_dict()  # {assignerOrgId: count}
+        
+        # Count baseline CVEs per CNA per calendar month, bucketed directly on an
+        # integer (year * 12 + month - 1) key rather than Period or datetime objects
+        baseline_df = df[in_baseline]
+        month_key = (baseline_df['dt'].dt.year * 12 + baseline_df['dt'].dt.month - 1).rename('month')
+        baseline_monthly = baseline_df.groupby(['assignerOrgId', month_key]).size()
+        
+        # (CNAs x months) matrix of baseline counts, 0 where a CNA published nothing that month
+        monthly_matrix = baseline_monthly.unstack(fill_value=0)
+        monthly_counts = monthly_matrix.to_numpy(dtype=float)
+        active_months = monthly_counts > 0
+        num_active_months = active_months.sum(axis=1)
+        
+        # Monthly average and sample std dev for all CNAs at once, over months with CVEs only.
+        # Std dev needs at least 3 months of data, otherwise it stays 0.
+        avg_monthly_arr = monthly_counts.sum(axis=1) / num_active_months
+        std_dev_arr = np.zeros(len(monthly_counts))
+        enough_data = num_active_months >= 3
+        if enough_data.any():
+            padded = np.where(active_months[enough_data], monthly_counts[enough_data], np.nan)
+            std_dev_arr[enough_data] = np.nanstd(padded, axis=1, ddof=1)
+        
+        cna_baselines = {
+            assigner_id: {
+                'avg_monthly': avg_monthly,
+                'short_name': cna_names.get(assigner_id, 'Unknown'),
+                'std_dev': std_dev
+            }
+            for assigner_id, avg_monthly, std_dev in zip(
+                monthly_matrix.index, avg_monthly_arr.tolist(), std_dev_arr.tolist()
+            )
+        }
+        
+        # Baseline counts for each timeline window as a (CNAs x 12) matrix, rows in cna_baselines order
+        timeline_counts = (
+            monthly_matrix
+            .reindex(columns=self.get_timeline_months(), fill_value=0)
+            .to_numpy()
+            .tolist()
+        )
         
         print(f"Found {len(cna_baselines)} CNAs with baseline data")
         print(f"Found {len(monitoring_counts)} CNAs with recent activity")
@@ -313,69 +577,39 @@ class CVEMonitor:
         
         # Find ALL official CNAs that we haven't seen yet (completely inactive)
         all_seen_cna_ids = set(cna_baselines.keys()) | set(monitoring_counts.keys())
-        official_cna_names = self.official_cna_list  # Use official list without duplicates
         
-        # Map official names to IDs we've seen
-        seen_cna_names = set()
-        for cna_id in all_seen_cna_ids:
-            name = cna_names.get(cna_id, 'Unknown')
-            if name != 'Unknown':
-                seen_cna_names.add(name)
+        # Case-folded names of the CNAs we've seen, comparable with the cna_org_names keys
+        seen_cna_names = {
+            cna_names[cna_id].casefold()
+            for cna_id in all_seen_cna_ids
+            if cna_names.get(cna_id, 'Unknown') != 'Unknown'
+        }
         
-        # Find CNAs in official list but not in our data
-        inactive_cna_names = official_cna_names - seen_cna_names
+        # Find CNAs in official list but not in our data (case-folded short names)
+        inactive_cna_names = self.cna_org_names.keys() - seen_cna_names
         print(f"Found {len(inactive_cna_names)} completely inactive CNAs (no CVEs in dataset)")
         
         # Analyze all CNAs (not just anomalies)
         anomalies = []
         all_cnas = []
         
+        # Classify all CNAs with baseline data in one vectorized pass
+        current_count_arr = np.array([monitoring_counts.get(assigner_id, 0) for assigner_id in cna_baselines], dtype=float)
+        statuses, thresholds_low, thresholds_high, deviations = (
+            arr.tolist() for arr in _classify_activity(avg_monthly_arr, current_count_arr)
+        )
+        
         # Process CNAs with baseline data
-        for assigner_id, baseline_info in cna_baselines.items():
+        for i, (assigner_id, baseline_info) in enumerate(cna_baselines.items()):
             current_count = monitoring_counts.get(assigner_id, 0)
             avg_monthly = baseline_info['avg_monthly']
-            monthly_counts = baseline_info['monthly_counts']
+            std_dev = baseline_info['std_dev']
             
-            # Calculate expected count for monitoring window (30 days ≈ 1 month)
-            expected_count = avg_monthly
-            
-            # Calculate standard deviation if we have enough data
-            if len(monthly_counts) >= 3:
-                try:
-                    std_dev = statistics.stdev(monthly_counts)
-                except statistics.StatisticsError:
-                    std_dev = 0
-            else:
-                std_dev = 0
-            
-            # Status thresholds
-            # Normal = within 50% to 250% of baseline (-50% to +150% growth)
-            # Declining = below 50% of baseline (below -50% from baseline)
-            # Growth = above 250% of baseline (above +150% growth)
-            threshold_low = avg_monthly * 0.5  # Below 50% of baseline is Declining
-            threshold_high = avg_monthly * 2.5  # Above 250% of baseline is Growth
-            
-            # Identify status type based on deviation from baseline
-            anomaly_type = None
-            
-            # Growth: Above 250% of baseline (+150% growth)
-            if current_count > threshold_high:
-                anomaly_type = "Growth"
-            
-            # Declining: Below 50% of baseline (-50% from baseline)
-            # Only flag if baseline was meaningful (>=0.5 CVEs/month)
-            elif current_count < threshold_low and avg_monthly >= 0.5:
-                anomaly_type = "Declining"
-            
-            # Otherwise: Normal (within 50% to 250% of baseline)
-            
-            # Determine status for all CNAs
-            if anomaly_type:
-                status = anomaly_type  # "Growth" or "Declining"
-            else:
-                status = "Normal"
-            
-            deviation_pct = ((current_count - avg_monthly) / avg_monthly * 100) if avg_monthly > 0 else 0
+            status = statuses[i]
+            anomaly_type = status if status != 'Normal' else None  # "Growth" or "Declining"
+            threshold_low = thresholds_low[i]
+            threshold_high = thresholds_high[i]
+            deviation_pct = deviations[i]
             
             # Calculate days since last CVE
             last_cve_date = last_cve_dates.get(assigner_id)
@@ -394,10 +628,7 @@ class CVEMonitor:
             advisory_url = cna_info.get('advisory_url', '')
             
             # Generate 13-month timeline for detail page
-            timeline_13months = self.generate_13month_timeline(
-                baseline_info.get('monthly_data', {}),
-                current_count
-            )
+            timeline_13months = self.generate_13month_timeline(timeline_counts[i], current_count)
             
             cna_entry = {
                 'assigner_id': assigner_id,
@@ -447,7 +678,7 @@ class CVEMonitor:
             advisory_url = cna_info.get('advisory_url', '')
             
             # Generate 13-month timeline for new CNAs (all zeros + current)
-            timeline_13months = self.generate_13month_timeline({}, current_count)
+            timeline_13months = self.generate_13month_timeline([0] * 12, current_count)
             
             # New CNAs are marked as "Growth" (went from 0 to something)
             cna_entry = {
@@ -470,13 +701,14 @@ class CVEMonitor:
             anomalies.append(cna_entry)  # New CNAs are anomalies
         
         # Process completely inactive CNAs (in official list but no CVEs in dataset)
-        for short_name in inactive_cna_names:
-            cna_info = self.get_cna_info(short_name, None)
+        for name_key in inactive_cna_names:
+            cna_info = self.cna_org_names[name_key]
+            short_name = cna_info['short_name']
             org_name = cna_info.get('org_name', short_name)
             advisory_url = cna_info.get('advisory_url', '')
             
             # Generate 13-month timeline for inactive CNAs (all zeros)
-            timeline_13months = self.generate_13month_timeline({}, 0)
+            timeline_13months = self.generate_13month_timeline([0] * 12, 0)
             
             # Completely inactive CNAs - marked as "Inactive" (their own category)
             cna_entry = {
@@ -512,10 +744,13 @@ class CVEMonitor:
         
         print(f"Identified {len(anomalies)} anomalous CNAs")
         print(f"Total CNAs analyzed: {len(all_cnas)}")
-        print(f"  - Growth: {sum(1 for c in all_cnas if c['status'] == 'Growth')}")
-        print(f"  - Normal: {sum(1 for c in all_cnas if c['status'] == 'Normal')}")
-        print(f"  - Declining: {sum(1 for c in all_cnas if c['status'] == 'Declining')}")
-        print(f"  - Inactive: {sum(1 for c in all_cnas if c['status'] == 'Inactive')}")
+        
+        # Count statuses in a single pass
+        status_counts = Counter(c['status'] for c in all_cnas)
+        print(f"  - Growth: {status_counts['Growth']}")
+        print(f"  - Normal: {status_counts['Normal']}")
+        print(f"  - Declining: {status_counts['Declining']}")
+        print(f"  - Inactive: {status_counts['Inactive']}")
         
         # Prepare metadata
         metadata = {
@@ -528,10 +763,10 @@ class CVEMonitor:
             'baseline_end': baseline_end.isoformat(),
             'total_cnas': len(all_cnas),
             'total_anomalies': len(anomalies),
-            'cnas_growth': sum(1 for c in all_cnas if c['status'] == 'Growth'),
-            'cnas_normal': sum(1 for c in all_cnas if c['status'] == 'Normal'),
-            'cnas_declining': sum(1 for c in all_cnas if c['status'] == 'Declining'),
-            'cnas_inactive': sum(1 for c in all_cnas if c['status'] == 'Inactive')
+            'cnas_growth': status_counts['Growth'],
+            'cnas_normal': status_counts['Normal'],
+            'cnas_declining': status_counts['Declining'],
+            'cnas_inactive': status_counts['Inactive']
         }
         
         return {
@@ -549,9 +784,24 @@ class CVEMonitor:
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
         
-        # Write JSON
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        # Write JSON one top-level value and one list element at a time, so the whole
+        # report is never held as a single serialized buffer. The output is identical
+        # to a plain indent=2 dump.
+        with open(output_file, 'wb') as f:
+            f.write(b'{')
+            for i, (key, value) in enumerate(results.items()):
+                f.write(b',\n  ' if i else b'\n  ')
+                f.write(_dumps_json(key) + b': ')
+                
+                if isinstance(value, list) and value:
+                    f.write(b'[')
+                    for j, item in enumerate(value):
+                        f.write(b',\n    ' if j else b'\n    ')
+                        f.write(_dumps_json(item).replace(b'\n', b'\n    '))
+                    f.write(b'\n  ]')
+                else:
+                    f.write(_dumps_json(value).replace(b'\n', b'\n  '))
+            f.write(b'\n}')
         
         print(f"Results saved successfully")
         print(f"Total CNAs: {results['metadata']['total_cnas']}")
@@ -571,7 +821,7 @@ class CVEMonitor:
         
         # Step 2: Parse CVE files
         cve_data = self.parse_cve_files()
-        if not cve_data:
+        if not cve_data['cveId']:
             print("No CVE data found. Exiting.")
             return False
         